@@ -0,0 +1,16 @@
+"""
+Interpreted Sanic glue for the optionally mypyc-compiled client module.
+
+Sanic's route registration inspects the handler's signature, which
+compiled functions don't expose, so the route callback lives here.
+"""
+
+__all__ = (
+    'make_handle_request',
+)
+
+def make_handle_request(client):
+    async def handle_request(request):
+        return await client._handle_request(request)
+
+    return handle_request
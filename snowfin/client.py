@@ -1,11 +1,12 @@
 import asyncio
+from binascii import a2b_hex as _unhex
 from contextlib import suppress
 from dataclasses import dataclass
 import functools
 import importlib
 import inspect
 import sys
-from typing import Callable, Optional
+from typing import Any, Callable, Coroutine, Optional
 from functools import partial
 
 from sanic import Sanic, Request
@@ -13,28 +14,41 @@ import sanic
 from sanic.response import HTTPResponse, json
 from sanic.log import logger
 
-from nacl.signing import VerifyKey
-from nacl.exceptions import BadSignatureError
+import msgspec
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
 from dacite import from_dict, config
 from snowfin.components import Components, TextInput, is_component
 from snowfin.errors import CogLoadError
 
-from snowfin.models import *
+# explicit imports: mypyc-compiled modules can't execute wildcard
+# relative imports
+from snowfin.models import Interaction, User
 from snowfin.module import Module
-from .decorators import Interactable, InteractionCommand
+from .decorators import (
+    ComponentCallback,
+    ContextMenu,
+    Interactable,
+    InteractionCommand,
+    Listener,
+    ModalCallback,
+    SlashCommand,
+)
+from ._routes import make_handle_request
+from .embed import Embed
 from .response import _DiscordResponse, AutocompleteResponse, DeferredResponse, MessageResponse, ModalResponse
-from .http import *
-from .decorators import *
-from .enums import *
-
-from json import dumps
+from .http import HTTP
+from .enums import ChannelType, CommandType, ComponentType, OptionType, RequestType, ResponseType
 
 __all__ = (
     'Client',
     'AutoDefer',
 )
 
+# built once at import time; only the startup command-sync path still
+# goes through dacite, nothing per-request does
 cast_config=config.Config(
     cast=[
         int,
@@ -46,10 +60,46 @@ cast_config=config.Config(
     ]
 )
 
+# built once at import time; decodes raw request bodies straight into
+# typed models without a per-request reflection pass
+interaction_decoder = msgspec.json.Decoder(Interaction, strict=False)
+
+def _mk_caster(annotation: type) -> Callable:
+    """
+    Build a caster for one command argument. The closure skips the
+    constructor call entirely when the value already has the right type.
+    """
+    def cast(value):
+        return value if type(value) is annotation else annotation(value)
+    return cast
+
+async def _race(task: asyncio.Task, timeout: float, loop: asyncio.AbstractEventLoop) -> bool:
+    """
+    Wait on a single task with a timeout, without the set bookkeeping
+    asyncio.wait does for the general case. Returns True if the task
+    finished in time, False if the timer won.
+    """
+    fut: asyncio.Future[bool] = loop.create_future()
+
+    def on_timeout() -> None:
+        if not fut.done():
+            fut.set_result(False)
+
+    def on_done(t: asyncio.Task) -> None:
+        if not fut.done():
+            fut.set_result(True)
+
+    handle = loop.call_later(timeout, on_timeout)
+    task.add_done_callback(on_done)
+    try:
+        return await fut
+    finally:
+        handle.cancel()
+
 @dataclass
 class AutoDefer:
     enabled: bool = False
-    timeout: int = 1
+    timeout: float = 1
     ephemeral: bool = False
 
 class Client:
@@ -57,26 +107,29 @@ class Client:
     def __init__(
         self,
         verify_key: str,
-        application_id: int,
+        application_id: int | str,
+        token: Optional[str] = None,
         sync_commands: bool = False,
-        token: str = None,
         auto_defer: AutoDefer | bool = AutoDefer(),
-        app: Sanic = None,
+        app: Optional[Sanic] = None,
         logging_level: int = 1,
         **kwargs
     ):
         # create a new app if none is not supplied
         if app is None:
-            self.app = Sanic("snowfin-interactions")
+            self.app: Sanic = Sanic("snowfin-interactions")
         else:
             self.app = app
-        self.verify_key = VerifyKey(bytes.fromhex(verify_key))
+        self.verify_key = Ed25519PublicKey.from_public_bytes(bytes.fromhex(verify_key))
+        # bound once so the per-request middleware skips the attribute lookups
+        self._verify = self.verify_key.verify
 
-        # automatic defer options
-        self.auto_defer = auto_defer or AutoDefer()
-
-        if self.auto_defer is True:
-            self.auto_defer = AutoDefer(enabled=True)
+        # automatic defer options; normalize the bool shorthand up front
+        if auto_defer is True:
+            auto_defer = AutoDefer(enabled=True)
+        elif not auto_defer:
+            auto_defer = AutoDefer()
+        self.auto_defer: AutoDefer = auto_defer
 
         self.sync_commands = sync_commands
 
@@ -91,18 +144,26 @@ class Client:
             headers=kwargs.get('headers', None),
         )
 
-        self.user: User = None
+        self.user: Optional[User] = None
 
-        self.modules = {}
+        self.modules: dict[str, list[Module]] = {}
 
         # listeners for events (read only events)
         self._listeners: dict[str, list] = {}
 
         # strict callbacks (returns a response)
-        self.commands: list[InteractionCommand] = []
+        self._commands_by_name: dict[str, InteractionCommand] = {}
         self.modals: dict[str, ModalCallback] = {}
         self.components: dict[tuple[str, ComponentType], ComponentCallback] = {}
 
+        # request type -> handler, looked up once per request in _handle_request
+        self._request_dispatch = {
+            RequestType.APPLICATION_COMMAND: self._dispatch_command,
+            RequestType.APPLICATION_COMMAND_AUTOCOMPLETE: self._dispatch_autocomplete,
+            RequestType.MESSAGE_COMPONENT: self._dispatch_component,
+            RequestType.MODAL_SUBMIT: self._dispatch_modal,
+        }
+
         # gather callbacks
         self._gather_callbacks()
 
@@ -122,41 +183,49 @@ class Client:
         # create middlware for verifying that discord is the one who sent the interaction
         @self.app.on_request
         async def verify_signature(request: Request):
-            signature = request.headers["X-Signature-Ed25519"]
-            timestamp = request.headers["X-Signature-Timestamp"]
-            body = request.body.decode("utf-8")
+            # the body is already bytes and the timestamp header is ascii,
+            # so concatenate directly instead of decoding and re-encoding
+            signature = _unhex(request.headers["X-Signature-Ed25519"])
+            timestamp = request.headers["X-Signature-Timestamp"].encode("ascii")
 
             try:
-                self.verify_key.verify(f'{timestamp}{body}'.encode(), bytes.fromhex(signature))
-            except BadSignatureError:
+                # join preallocates the result for a two-buffer concat
+                self._verify(signature, b"".join((timestamp, request.body)))
+            except InvalidSignature:
                 return json({"error": "invalid signature"}, status=403)
 
         # send PONGs to PINGs and construct the interaction context
         @self.app.on_request
         async def ack_request(request: Request):
-            if request.json.get('type') == RequestType.PING.value:
+            body = request.body
+
+            # PINGs are the only interaction without a data field (and a
+            # key can't hide inside a string value unescaped), so this
+            # byte probe answers them without building an Interaction
+            if b'"data"' not in body and (b'"type":1' in body or b'"type": 1' in body):
                 return json({"type": 1})
 
-            # if self.app.debug:
-            #     self.log(f"{request.method} {request.path}\n\n{dumps(request.json, indent=2)}")
+            # single parse of the body; request.json (and its ujson pass)
+            # is never touched
+            request.ctx = interaction_decoder.decode(body)  # type: ignore[assignment]
 
-            request.ctx = from_dict(
-                data= request.json,
-                data_class=Interaction,
-                config=cast_config
-            )
+            if request.ctx.type is RequestType.PING:
+                return json({"type": 1})
 
             request.ctx.client = self
 
-        # handle user callbacks
-        @self.app.post("/")
-        async def handle_request(request: Request):
-            return await self._handle_request(request)
+        # handle user callbacks; the handler comes from an interpreted
+        # module because Sanic introspects route-handler signatures
+        self.app.add_route(make_handle_request(self), "/", methods=["POST"])
 
         logger.info("Client initialized")
 
     @property
-    def loop(self):
+    def commands(self) -> list[InteractionCommand]:
+        return list(self._commands_by_name.values())
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
         try:
             return self.app.loop
         except sanic.exceptions.SanicException:
@@ -176,34 +245,48 @@ class Client:
             ]
 
             current_commands = [x.to_dict() for x in current_commands]
-            gathered_commands = [x.to_dict() for x in self.commands]
+            gathered_commands = [x._serialized for x in self.commands]
 
             for cmd in gathered_commands:
                 if cmd not in current_commands:
-                    
-                    self.log(f"syncing {len(self.commands)} commands")
+
+                    self.log(f"syncing {len(gathered_commands)} commands")
                     await self.http.bulk_overwrite_global_application_commands(gathered_commands)
-                    self.log(f"synced {len(self.commands)} commands")
+                    self.log(f"synced {len(gathered_commands)} commands")
 
                     return
                 
 
     def _handle_deferred_routine(self, routine: asyncio.Task, request, after: Optional[Callable]):
         """
-        Create a wrapper for the task supplied and wait on it.
-        log any errors and pass the result onward
+        Watch the task supplied and pass the result onward once it finishes.
+        A done callback avoids allocating a wrapper coroutine and an extra
+        Task per deferred request.
         """
-        async def wrapper():
-            try:
-                response = await routine
-                await self._handle_deferred_response(request, response)
+        routine.add_done_callback(partial(self._on_deferred_done, request=request, after=after))
 
-                # call the after callback if it exists
-                if after:
-                    await self._handle_followup_response(request, after)
-            except Exception as e:
-                logger.error(e.__repr__())
-        asyncio.create_task(wrapper())
+    def _on_deferred_done(self, task: asyncio.Task, request, after: Optional[Callable]):
+        if task.cancelled():
+            return
+
+        if (error := task.exception()) is not None:
+            logger.error(error.__repr__())
+            return
+
+        asyncio.create_task(
+            self._finish_deferred_routine(task.result(), request, after),
+            name="snowfin:: deferred response"
+        )
+
+    async def _finish_deferred_routine(self, response, request, after: Optional[Callable]):
+        try:
+            await self._handle_deferred_response(request, response)
+
+            # call the after callback if it exists
+            if after:
+                await self._handle_followup_response(request, after)
+        except Exception as e:
+            logger.error(e.__repr__())
 
     async def _handle_deferred_response(self, request, response):
         """
@@ -233,8 +316,8 @@ class Client:
                 raise Exception("Invalid response type")
 
     def infer_response(self, resp: Any) -> _DiscordResponse:
-        kwargs = {}
-        chosen_type = None
+        kwargs: dict[str, Any] = {}
+        chosen_type: Optional[type[_DiscordResponse]] = None
 
         if not isinstance(resp, tuple):
             resp = [resp]
@@ -277,98 +360,125 @@ class Client:
 
         return (chosen_type or MessageResponse)(**kwargs)
 
-    async def _handle_request(self, request: Request) -> HTTPResponse:
-        """
-        Grab the callback Coroutine and create a task.
-        """
-        # handle the before requests
-        self.dispatch('before_request', request.ctx)
+    def _dispatch_command(self, request: Request) -> tuple[Optional[Coroutine], Optional[Callable]]:
+        ctx: Interaction = request.ctx  # type: ignore[assignment]
+        self.dispatch('command', ctx)
 
-        func: Optional[Callable] = None
-        after: Optional[Callable] = None
+        if cmd := self.get_command(ctx.data.name):
+            kwargs = {}
+            for option in ctx.data.options:
+                name = option.name
+                if option.type in (OptionType.CHANNEL, OptionType.USER, OptionType.ROLE, OptionType.MENTIONABLE):
+                    kwargs[name] = ctx.data.resolved.get(option.type, option.value)
+                else:
+                    value = option.value
 
-        if request.ctx.type is RequestType.APPLICATION_COMMAND:
-            self.dispatch('command', request.ctx)
+                    # cast to the annotated type if the callback asked for one
+                    if (cast := cmd._arg_casters.get(name)) is not None:
+                        try:
+                            value = cast(value)
+                        except Exception:
+                            pass
 
-            if cmd := self.get_command(request.ctx.data.name):
-                kwargs = {}
+                    kwargs[name] = value
 
-                for option in request.ctx.data.options:
+            return (
+                cmd.callback(ctx, **kwargs),  # type: ignore[misc]
+                partial(cmd.after_callback, ctx, **kwargs) if cmd.after_callback else None
+            )
 
-                    converted = option.value
-                    if option.type in (OptionType.CHANNEL, OptionType.USER, OptionType.ROLE, OptionType.MENTIONABLE):
-                        converted = request.ctx.data.resolved.get(option.type, option.value)
-                    else:
-                        converted = type(option.value)
+        return None, None
 
-                    kwargs[option.name] = converted
-                        
+    def _dispatch_autocomplete(self, request: Request) -> tuple[Optional[Coroutine], Optional[Callable]]:
+        ctx: Interaction = request.ctx  # type: ignore[assignment]
+        self.dispatch('autocomplete', ctx)
 
-                func = partial(cmd.callback, request.ctx, **kwargs)
-                if cmd.after_callback:
-                    after = partial(cmd.after_callback, request.ctx, **kwargs)
+        if cmd := self.get_command(ctx.data.name):
+            for option in ctx.data.options:
+                if option.focused:
+                    # only SlashCommand carries autocomplete callbacks
+                    callback = getattr(cmd, 'autocomplete_callbacks', {}).get(option.name)
+                    if callback:
+                        return callback(ctx, option.value), None
+                    break
 
-        elif request.ctx.type is RequestType.APPLICATION_COMMAND_AUTOCOMPLETE:
-            self.dispatch('autocomplete', request.ctx)
+        return None, None
 
-            if cmd := self.get_command(request.ctx.data.name):
-                for option in request.ctx.data.options:
-                    if option.focused:
-                        callback = cmd.autocomplete_callbacks.get(option.name)
-                        if callback:
-                            func = partial(callback, request.ctx, option.value)
-                        break
+    def _dispatch_component(self, request: Request) -> tuple[Optional[Coroutine], Optional[Callable]]:
+        ctx: Interaction = request.ctx  # type: ignore[assignment]
+        self.dispatch('component', ctx)
 
-        elif request.ctx.type is RequestType.MESSAGE_COMPONENT:
-            self.dispatch('component', request.ctx)
+        return self.package_component_callback(
+            ctx.data.custom_id,
+            ctx.data.component_type,
+            ctx
+        )
+
+    def _dispatch_modal(self, request: Request) -> tuple[Optional[Coroutine], Optional[Callable]]:
+        ctx: Interaction = request.ctx  # type: ignore[assignment]
+        self.dispatch('modal', ctx)
 
-            func, after = self.package_component_callback(
-                request.ctx.data.custom_id,
-                request.ctx.data.component_type,
-                request.ctx
+        if modal := self.modals.get(ctx.data.custom_id):
+            return (
+                modal(ctx),
+                partial(modal.after_callback, ctx) if modal.after_callback else None
             )
 
-        elif request.ctx.type is RequestType.MODAL_SUBMIT:
-            self.dispatch('modal', request.ctx)
+        return None, None
 
-            if modal := self.modals.get(request.ctx.data.custom_id):
-                func = partial(modal, request.ctx)
+    async def _handle_request(self, request: Request) -> Optional[HTTPResponse]:
+        """
+        Grab the callback Coroutine and create a task.
+        """
+        # bind the hot lookups once; each attribute access below would
+        # otherwise be a fresh dict lookup per use
+        ctx: Interaction = request.ctx  # type: ignore[assignment]
+        ctx_type = ctx.type
+        auto_defer = self.auto_defer
 
-                if modal.after_callback:
-                    after = partial(modal.after_callback, request.ctx)
+        # handle the before requests
+        self.dispatch('before_request', ctx)
 
-        if self.app.debug: self.log(f"getting callback for {request.ctx.type}: found", f"{func.func.__name__}{func.args[1:]}" if func else None)
+        coro: Optional[Coroutine] = None
+        after: Optional[Callable] = None
 
-        if func:
-            task = asyncio.create_task(func())
+        # one dict lookup instead of an if/elif chain over request types
+        handler = self._request_dispatch.get(ctx_type)
+        if handler is not None:
+            coro, after = handler(request)
 
-            # auto defer if and only if the decorator and/or client told us too and it *can* be defered
-            if self.auto_defer.enabled and \
-                request.ctx.type in (RequestType.APPLICATION_COMMAND, RequestType.MESSAGE_COMPONENT):
-                # we want to defer automatically and keep the original task going
-                # so we wait for up to the timeout, then construct a DeferredResponse ourselves
-                # then handle_deferred_routine() will do the rest
-                done, pending = await asyncio.wait([task], timeout = self.auto_defer.timeout)
+        # %-style args defer the formatting until a handler actually emits
+        logger.debug("getting callback for %s: found %s", ctx_type, coro)
 
+        if coro is None:
+            return json({"error": "command not found"}, status=404)
 
-                if task in pending:
-                    # task didn't return in time, let it keep going and construct a defer for it
-                    resp = DeferredResponse(task,
-                        ephemeral=self.auto_defer.ephemeral
-                    )
-                else:
-                    # the task returned in time, get the result and use that like normal
-                    resp = task.result()
+        task = asyncio.create_task(coro)
+
+        # auto defer if and only if the decorator and/or client told us too and it *can* be defered
+        if auto_defer.enabled and \
+            ctx_type in (RequestType.APPLICATION_COMMAND, RequestType.MESSAGE_COMPONENT):
+            # we want to defer automatically and keep the original task going
+            # so we wait for up to the timeout, then construct a DeferredResponse ourselves
+            # then handle_deferred_routine() will do the rest
+            finished = await _race(task, auto_defer.timeout, asyncio.get_running_loop())
+
+            if finished:
+                # the task returned in time, get the result and use that like normal
+                resp = task.result()
             else:
-                resp = await task
+                # task didn't return in time, let it keep going and construct a defer for it
+                resp = DeferredResponse(task,
+                    ephemeral=auto_defer.ephemeral
+                )
         else:
-            return json({"error": "command not found"}, status=404)
+            resp = await task
 
-        if request.ctx.responded:
+        if ctx.responded:
             raise Exception("Callback already responded")
 
         if not isinstance(resp, DeferredResponse):
-            request.ctx.responded = True
+            ctx.responded = True
 
         if not isinstance(resp, (_DiscordResponse, HTTPResponse)):
             resp = self.infer_response(resp)
@@ -376,14 +486,14 @@ class Client:
         if isinstance(resp, _DiscordResponse):
             if isinstance(resp, DeferredResponse):
                 # make sure we are sending the correct interaction response type for the request
-                if request.ctx.type == RequestType.MESSAGE_COMPONENT:
+                if ctx_type == RequestType.MESSAGE_COMPONENT:
                     resp.type = ResponseType.COMPONENT_DEFER
                 else:
                     resp.type = ResponseType.DEFER
 
                 # if someone passed in a callable, construct a task for them to keep syntax as clean as possible
                 if not isinstance(resp.task, asyncio.Task):
-                    resp.task = asyncio.create_task(resp.task(self, request.ctx))
+                    resp.task = asyncio.create_task(resp.task(self, ctx))
 
                 # start or continue the task and post the response to a webhook
                 self._handle_deferred_routine(resp.task, request, after)
@@ -391,16 +501,18 @@ class Client:
                 # launch after callbacks if there is any and the command is not a deferred one
                 if after:
                     asyncio.create_task(self._handle_followup_response(request, after))
-            
+
             # do some logging and return the 'dictified' data
             data = resp.to_dict()
-            if self.app.debug: self.log(f"RESPONDING {request.ctx.type} `{getattr(request.ctx.data, 'name', None)}`", data)
+            logger.debug("RESPONDING %s `%s` %s", ctx_type, getattr(ctx.data, 'name', None), data)
             return json(data)
 
         elif isinstance(resp, HTTPResponse):
             # someone gave us a sanic response, Assume they know what they are doing
             return resp
 
+        return None
+
 
     def run(self, host: str, port: int, **kwargs):
         self.app.run(host=host, port=port, access_log=False, **kwargs)
@@ -434,15 +546,15 @@ class Client:
 
         modules: list[Module] = self.modules.pop(module_name)
 
-        for module in modules:
-            if hasattr(module, "on_unload"):
-                module.on_unload()
+        for loaded in modules:
+            if hasattr(loaded, "on_unload"):
+                loaded.on_unload()
 
             # unload all callbacks
-            for callback in module.callbacks:
+            for callback in loaded.callbacks:
                 self.remove_callback(callback)
 
-            del module
+            del loaded
 
     def get_module(self, name: str) -> Optional[Module]:
         """
@@ -454,6 +566,8 @@ class Client:
                 if module.__class__.__name__ == name:
                     return module
 
+        return None
+
     def _ingest_callbacks(self, *callbacks: Interactable):
         for func in callbacks:
             if isinstance(func, InteractionCommand):
@@ -469,7 +583,18 @@ class Client:
         """
         Gather all callbacks from loaded modules
         """
-        callbacks = [obj for _, obj in inspect.getmembers(sys.modules["__main__"]) + inspect.getmembers(self) if isinstance(obj, Interactable)]
+        # vars() is a plain dict walk; inspect.getmembers would sort the
+        # names and trigger a getattr (and any descriptor) per attribute
+        candidates = list(vars(sys.modules["__main__"]).values())
+        candidates += [obj for _, obj in inspect.getmembers(self)]
+
+        seen: set[int] = set()
+        callbacks = []
+        for obj in candidates:
+            if isinstance(obj, Interactable) and id(obj) not in seen:
+                seen.add(id(obj))
+                callbacks.append(obj)
+
         self._ingest_callbacks(*callbacks)
         self.log(f"Gathered {len(callbacks)} immediate callbacks")
 
@@ -477,10 +602,22 @@ class Client:
         """
         Add a command to the client
         """
-        if command.name in [x.name for x in self.commands]:
+        if command.name in self._commands_by_name:
             raise ValueError(f"/{command.name} already exists")
 
-        self.commands.append(command)
+        # prebuild one caster per annotated argument so dispatch doesn't
+        # have to walk __annotations__ or re-select types per invocation
+        callback = command.callback
+        if isinstance(callback, functools.partial):
+            callback = callback.func
+
+        command._arg_casters = {
+            name: _mk_caster(annotation)
+            for name, annotation in getattr(callback, '__annotations__', {}).items()
+            if name not in ('self', 'ctx', 'context', 'return')
+        }
+
+        self._commands_by_name[command.name] = command
 
     def add_listener(self, listener: Listener):
         """
@@ -515,22 +652,25 @@ class Client:
         """
         Dispatch an event to all listeners
         """
-        self.log(f"Dispatching {event}")
-        for listener in self._listeners.get(event, []):
+        # most events have no listeners; bail before any other work
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+
+        logger.debug("Dispatching %s", event)
+        for listener in listeners:
             asyncio.create_task(
                 listener(*args, **kwargs),
                 name=f"snowfin:: {event}"
             )
 
-    def get_command(self, name: str) -> InteractionCommand:
+    def get_command(self, name: str) -> Optional[InteractionCommand]:
         """
         Get a command by name
         """
-        for command in self.commands:
-            if command.name == name:
-                return command
+        return self._commands_by_name.get(name)
 
-    def package_component_callback(self, custom_id: str, component_type: ComponentType, ctx: Interaction) -> Callable:
+    def package_component_callback(self, custom_id: str, component_type: ComponentType, ctx: Interaction) -> tuple[Optional[Coroutine], Optional[Callable]]:
          # loop through all all our registered component callbacks
         for (_id, _type), callback in self.components.items():
 
@@ -588,7 +728,7 @@ class Client:
 
 
                 return (
-                    functools.partial(callback.callback, ctx, **kwargs),
+                    callback.callback(ctx, **kwargs),  # type: ignore[misc]
                     functools.partial(callback.after_callback, ctx, **kwargs) if callback.after_callback else None
                 )
 
@@ -600,7 +740,7 @@ class Client:
         Remove a callback from the client
         """
         if isinstance(callback, InteractionCommand):
-            self.commands.remove(callback)
+            self._commands_by_name.pop(callback.name, None)
         elif isinstance(callback, Listener):
             self._listeners.get(callback.event_name, []).remove(callback)
         elif isinstance(callback, ComponentCallback):
@@ -610,10 +750,12 @@ class Client:
 
 
 
-    async def fetch_user(self, user_id: int) -> User:
+    async def fetch_user(self, user_id: int | str) -> Optional[User]:
         """
         Fetch a user object
         """
         data = await self.http.fetch_user(user_id)
         if data is not None:
-            return from_dict(User, data, config=cast_config)
\ No newline at end of file
+            return msgspec.convert(data, User, strict=False)
+
+        return None
\ No newline at end of file
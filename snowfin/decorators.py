@@ -1,4 +1,5 @@
 import asyncio
+import functools
 from dataclasses import dataclass, field, asdict
 from typing import Callable, Optional, Union
 
@@ -79,6 +80,16 @@ class InteractionCommand(Interactable, FollowupMixin):
     name: str = None
     default_permission: bool = True
 
+    # filled in by Client.add_interaction_command; one prebuilt caster
+    # per annotated callback argument
+    _arg_casters: dict[str, Callable] = field(default_factory=dict, repr=False, compare=False)
+
+    @functools.cached_property
+    def _serialized(self) -> dict:
+        # memoized to_dict() so command syncing doesn't rewalk the
+        # option tree every time it serializes
+        return self.to_dict()
+
 @dataclass
 class ComponentCallback(Interactable, FollowupMixin, CustomIdMappingsMixin):
     """
@@ -174,6 +185,9 @@ class SlashCommand(InteractionCommand):
         def wrapper(callback):
             self.autocomplete_callbacks[option_name] = callback
 
+            # the options are about to change, drop any memoized serialization
+            self.__dict__.pop('_serialized', None)
+
             # set the autocomplete value in the corresponding option
             if self.options is None:
                 self.options = []
@@ -4,6 +4,7 @@ from typing import Any, Optional
 import aiohttp
 import json
 import sanic
+from sanic.log import logger
 from dataclasses import asdict
 from snowfin.decorators import SlashOption
 
@@ -94,7 +95,7 @@ class HTTP:
     """
     def __init__(
         self,
-        application_id: int,
+        application_id: int | str,
         token: Optional[str] = None,
         proxy: Optional[str] = None,
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
@@ -131,7 +132,7 @@ class HTTP:
         """
         Make a followup request
         """
-        print(f"Requesting {route.method} {route.url} with {data}")
+        logger.debug("Requesting %s %s with %s", route.method, route.url, data)
 
         headers = self.headers.copy()
 
@@ -166,7 +167,7 @@ class HTTP:
                 except KeyError:
                     pass
 
-                print(f"Got discord response ({response.status}): {response_data}")
+                logger.debug("Got discord response (%s): %s", response.status, response_data)
 
                 if 300 > response.status >= 200:
                     return response_data
@@ -218,7 +219,6 @@ class HTTP:
         )
 
         data = response.to_dict().get('data', {})
-        print(data)
 
         return self.request(r,
             data=data,
@@ -396,7 +396,7 @@ class HTTP:
 
     def fetch_user(
         self,
-        user_id: int,
+        user_id: int | str,
         **kwargs
     ) -> Any:
         """
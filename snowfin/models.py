@@ -1,12 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from dacite import from_dict, config
 from typing import Any, Dict, List, Optional, Union
 
+import msgspec
+
 from snowfin.components import ActionRow, Components
 
 from .enums import ChannelType, OptionType, CommandType, ComponentType, Permissions, RequestType
-from .embed import Embed
 
 @dataclass
 class Choice:
@@ -22,16 +22,16 @@ class User:
     username: str
     discriminator: str
     avatar: str
-    bot: Optional[bool]
-    mfa_enabled: Optional[bool]
-    banner: Optional[str]
-    accent_color: Optional[str]
-    locale: Optional[str]
-    verified: Optional[bool]
-    email: Optional[str]
-    flags: Optional[int]
-    premium_type: Optional[int]
-    public_flags: Optional[int]
+    bot: Optional[bool] = None
+    mfa_enabled: Optional[bool] = None
+    banner: Optional[str] = None
+    accent_color: Optional[str] = None
+    locale: Optional[str] = None
+    verified: Optional[bool] = None
+    email: Optional[str] = None
+    flags: Optional[int] = None
+    premium_type: Optional[int] = None
+    public_flags: Optional[int] = None
 
     @property
     def avatar_url(self) -> str:
@@ -39,17 +39,17 @@ class User:
 
 @dataclass
 class Member:
-    user: Optional[User]
-    nick: Optional[str]
-    avatar: Optional[str]
     roles: list[int]
-    joined_at: Optional[str]
-    premium_since: Optional[str]
-    deaf: Optional[bool]
-    mute: Optional[bool]
-    pending: Optional[bool]
-    permissions: Optional[int]
-    communication_disabled_until: Optional[str]
+    user: Optional[User] = None
+    nick: Optional[str] = None
+    avatar: Optional[str] = None
+    joined_at: Optional[str] = None
+    premium_since: Optional[str] = None
+    deaf: Optional[bool] = None
+    mute: Optional[bool] = None
+    pending: Optional[bool] = None
+    permissions: Optional[int] = None
+    communication_disabled_until: Optional[str] = None
 
     def __post_init__(self):
         if self.joined_at:
@@ -71,9 +71,9 @@ class Member:
 
 @dataclass
 class RoleTags:
-    bot_id: Optional[int]
-    integration_id: Optional[int]
-    premium_subscriber: Optional[bool]
+    bot_id: Optional[int] = None
+    integration_id: Optional[int] = None
+    premium_subscriber: Optional[bool] = None
 
 @dataclass
 class Role:
@@ -81,13 +81,13 @@ class Role:
     name: str
     color: int
     hoist: bool
-    icon: Optional[str]
-    unicode_emoji: Optional[str]
     position: int
     permissions: int
     managed: bool
     mentionable: bool
-    tags: Optional[RoleTags]
+    icon: Optional[str] = None
+    unicode_emoji: Optional[str] = None
+    tags: Optional[RoleTags] = None
 
 @dataclass
 class Channel:
@@ -95,54 +95,54 @@ class Channel:
     name: str
     type: ChannelType
     permissions: int
-    thread_metadata: Optional[Dict]
-    parent_id: Optional[int]
+    thread_metadata: Optional[Dict] = None
+    parent_id: Optional[int] = None
 
 @dataclass
 class Component:
     """
     Discord command component
     """
-    custom_id: Optional[str]
-    component_type: Optional[ComponentType] # for when interaction data
-    type: Optional[OptionType] # for when in a message
-    values: Optional[List[str]] # for selects
-    value: Optional[str] # for inputs
-    label: Optional[str] # for inputs
-    components: Optional[List['Component']] # for action rows
-    style: Optional[int] # for non action rows
+    custom_id: Optional[str] = None
+    component_type: Optional[ComponentType] = None # for when interaction data
+    type: Optional[OptionType] = None # for when in a message
+    values: Optional[List[str]] = None # for selects
+    value: Optional[str] = None # for inputs
+    label: Optional[str] = None # for inputs
+    components: Optional[List['Component']] = None # for action rows
+    style: Optional[int] = None # for non action rows
 
 @dataclass
 class Message:
     id: int
     channel_id: int
-    guild_id: Optional[int]
-    author: Optional[User | Member]
-    member: Optional[Member]
     content: str
     timestamp: str
-    edited_timestamp: Optional[str]
     tts: bool
     mention_everyone: bool
     mention_roles: list[int]
     mentions: list[User]
     attachments: list[dict]
-    embeds: list[Embed]
-    reactions: Optional[list[dict]]
-    nonce: Optional[str | int]
+    embeds: list[dict]
     pinned: bool
-    webhook_id: Optional[int]
     type: int
-    activity: Optional[dict]
-    application: Optional[dict]
-    message_reference: Optional[dict]
-    flags: Optional[int]
-    referenced_message: Optional['Message']
-    interaction: Optional[dict]
-    thread: Optional[Channel]
-    components: Optional[list[dict]]
-    sticker_items: Optional[list[dict]]
-    stickers: Optional[list[dict]]
+    guild_id: Optional[int] = None
+    author: Optional[User] = None
+    member: Optional[Member] = None
+    edited_timestamp: Optional[str] = None
+    reactions: Optional[list[dict]] = None
+    nonce: Optional[str | int] = None
+    webhook_id: Optional[int] = None
+    activity: Optional[dict] = None
+    application: Optional[dict] = None
+    message_reference: Optional[dict] = None
+    flags: Optional[int] = None
+    referenced_message: Optional['Message'] = None
+    interaction: Optional[dict] = None
+    thread: Optional[Channel] = None
+    components: Optional[list[dict]] = None
+    sticker_items: Optional[list[dict]] = None
+    stickers: Optional[list[dict]] = None
 
     def __post_init__(self):
         if self.timestamp:
@@ -188,18 +188,18 @@ class Resolved:
 
 @dataclass
 class Option:
-    focused: Optional[bool]
     name: str
     type: OptionType
-    value: Optional[Union[str, int, float]]
+    value: Optional[Union[str, int, float]] = None
+    focused: Optional[bool] = None
 
 @dataclass
 class Command:
     id: int
     name: str
-    guild_id: Optional[int]
     type: CommandType
-    resolved: Optional[Resolved]
+    guild_id: Optional[int] = None
+    resolved: Optional[Resolved] = None
     options: List[Option] = field(default_factory=list)
 
 @dataclass
@@ -212,41 +212,37 @@ class Interaction:
     id: int
     application_id: int
     type: RequestType
-    data: Optional[dict]
-    guild_id: Optional[int]
-    channel_id: Optional[int]
-    member: Optional[Member]
-    user: Optional[User]
     token: str
     version: int
-    message: Optional[Message]
-    local: Optional[str]
-    guild_local: Optional[str]
+    # decoded as a plain mapping, then retyped to Command / Component /
+    # ModalSubmit in __post_init__
+    data: Any = None
+    guild_id: Optional[int] = None
+    channel_id: Optional[int] = None
+    member: Optional[Member] = None
+    user: Optional[User] = None
+    message: Optional[Message] = None
+    local: Optional[str] = None
+    guild_local: Optional[str] = None
 
     # added later
-    client: Optional[Any]
+    client: Optional[Any] = None
     responded: bool = False
 
     def __post_init__(self) -> None:
-        _config=config.Config(cast=[
-            int,
-            ChannelType,
-            CommandType,
-            OptionType,
-            ComponentType,
-            RequestType,
-            Permissions
-        ])
+        if self.type is RequestType.PING:
+            # PINGs carry no data; they get answered before dispatch
+            return
 
         if self.type in (RequestType.APPLICATION_COMMAND, RequestType.APPLICATION_COMMAND_AUTOCOMPLETE):
-            self.data = from_dict(Command, self.data, config=_config)
+            self.data = msgspec.convert(self.data, Command, strict=False)
         elif self.type is RequestType.MESSAGE_COMPONENT:
-            self.data = from_dict(Component, self.data, config=_config)
+            self.data = msgspec.convert(self.data, Component, strict=False)
         elif self.type is RequestType.MODAL_SUBMIT:
-            self.data = from_dict(ModalSubmit, self.data, config=_config)
+            self.data = msgspec.convert(self.data, ModalSubmit, strict=False)
         else:
             raise ValueError(f'Unknown request type: {self.type}')
 
     @property
     def author(self) -> Member | User:
-        return self.member if self.member else self.user
\ No newline at end of file
+        return self.member if self.member else self.user
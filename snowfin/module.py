@@ -15,6 +15,9 @@ class Module:
     description: Optional[str] = None,
     enabled: bool = True
 
+    # set per instance in __new__
+    callbacks: list[Interactable]
+
     def __new__(
         cls,
         client,